@@ -12,40 +12,91 @@ Features demonstrated:
 - Batch operations for cache seeding.
 """
 
-import json
+import struct
 import time
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from datetime import datetime
+from functools import partial
+from itertools import compress
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 from yellowdb import Batch, YellowDB
 
+# Header prepended to every cached value:
+# (expires_at in nanoseconds since the epoch, payload size in bytes)
+_HDR = struct.Struct("<QQ")
+_HDR_SIZE = _HDR.size
+_pack = _HDR.pack
+_unpack_from = _HDR.unpack_from
+# Leading expiry field of the header, for sweeps that need nothing else
+_unpack_expiry = struct.Struct("<Q").unpack_from
+
+# Bound once for the get/set hit path
+_loads = orjson.loads
+# Non-str dict keys are coerced to strings, as the stdlib json module did
+_dumps = partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+_time_ns = time.time_ns
+
+# Key prefixes used by the JSON-metadata layout that predates the binary header;
+# their values cannot be read by this version, so they are purged on startup
+_LEGACY_PREFIXES = ("cache:", "meta:")
+
+
+def _next_prefix(prefix: str) -> str:
+    """Return the smallest key that sorts after every key starting with prefix."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _find_expired(entries: List[Tuple[str, bytes]], now_ns: int) -> List[Tuple[str, bytes]]:
+    """Return the cached entries whose expires_at header field is before now_ns.
+
+    Only the leading expiry field is unpacked, and the comparison runs through
+    map/compress so no Python bytecode executes per entry.
+    """
+    expiries = map(itemgetter(0), map(_unpack_expiry, map(itemgetter(1), entries)))
+    return list(compress(entries, map(now_ns.__gt__, expiries)))
+
 
 class CacheLayer:
     """Application-level caching using YellowDB.
 
-    Implements cache-aside pattern with TTL support.
+    Implements cache-aside pattern with TTL support. Recently read entries are
+    kept in a small in-process LRU so hot keys skip the LSM lookup entirely.
     """
 
-    def __init__(self, db_path: str = "./cache_db", default_ttl: int = 3600):
+    def __init__(self, db_path: str = "./cache_db", default_ttl: int = 3600, max_hot: int = 4096):
         """Initialize cache layer.
 
         Args:
             db_path: Path to YellowDB directory
             default_ttl: Default time-to-live in seconds
+            max_hot: Maximum number of entries kept in the in-process LRU
 
         """
         self.db = YellowDB(data_directory=db_path)
         self.default_ttl = default_ttl
-        self.cache_prefix = "cache:"
-        self.metadata_prefix = "meta:"
-
-        # Statistics
-        self.stats = {
-            "hits": 0,
-            "misses": 0,
-            "writes": 0,
-            "evictions": 0,
-        }
+        self.cache_prefix = "cache.v2:"
+        self._cache_end = _next_prefix(self.cache_prefix)
+        self.max_hot = max_hot
+
+        # Hot entries: cache key -> (expires_at in nanoseconds, view of the serialized payload)
+        self._hot: OrderedDict[str, Tuple[int, memoryview]] = OrderedDict()
+
+        # Statistics, kept as plain attributes so hot-path increments skip dict hashing
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+        self._purge_legacy_entries()
+
+        # Entry count and payload bytes for get_stats, seeded by one scan at startup
+        entries = self.db.scan(start_key=self.cache_prefix, end_key=self._cache_end)
+        self._entries = entries.count()
+        self._bytes = sum(_unpack_from(value)[1] for _, value in entries)
 
     def get(self, key: str, loader_fn=None, ttl: Optional[int] = None) -> Optional[Any]:
         """Get value from cache.
@@ -61,22 +112,31 @@ class CacheLayer:
             Cached value or None
 
         """
-        cache_key = f"{self.cache_prefix}{key}"
-        meta_key = f"{self.metadata_prefix}{key}"
+        cache_key = self.cache_prefix + key
+        current_ns = _time_ns()
+
+        hot_entry = self._hot.get(cache_key)
+        if hot_entry is not None:
+            expires_ns, payload = hot_entry
+            if current_ns < expires_ns:
+                self._hot.move_to_end(cache_key)
+                self._hits += 1
+                return _loads(payload)
+            del self._hot[cache_key]
 
         cached_bytes = self.db.get(cache_key)
         if cached_bytes:
-            meta_bytes = self.db.get(meta_key)
-            if meta_bytes:
-                metadata = json.loads(meta_bytes.decode())
-                expires_at = datetime.fromisoformat(metadata["expires_at"])
-                if datetime.now() < expires_at:
-                    self.stats["hits"] += 1
-                    return json.loads(cached_bytes.decode())
+            cached_view = memoryview(cached_bytes)
+            expires_ns, _ = _unpack_from(cached_view)
+            if current_ns < expires_ns:
+                payload = cached_view[_HDR_SIZE:]
+                self._remember(cache_key, expires_ns, payload)
+                self._hits += 1
+                return _loads(payload)
             self.db.delete(cache_key)
-            self.db.delete(meta_key)
+            self._track_removal(cached_bytes)
 
-        self.stats["misses"] += 1
+        self._misses += 1
 
         if loader_fn:
             value = loader_fn()
@@ -95,24 +155,18 @@ class CacheLayer:
 
         """
         ttl = ttl or self.default_ttl
-        cache_key = f"{self.cache_prefix}{key}"
-        meta_key = f"{self.metadata_prefix}{key}"
-
-        value_bytes = json.dumps(value).encode()
-        metadata = {
-            "key": key,
-            "created_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(seconds=ttl)).isoformat(),
-            "ttl": ttl,
-            "size_bytes": len(value_bytes),
-        }
-        meta_bytes = json.dumps(metadata).encode()
+        cache_key = self.cache_prefix + key
 
-        with Batch(self.db) as batch:
-            batch.put(cache_key, value_bytes)
-            batch.put(meta_key, meta_bytes)
+        value_bytes = _dumps(value)
+        expires_ns = _time_ns() + ttl * 1_000_000_000
+        header = _pack(expires_ns, len(value_bytes))
+
+        previous = self.db.get(cache_key)
+        self.db.set(cache_key, header + value_bytes)
+        self._hot.pop(cache_key, None)
+        self._track_write(previous, len(value_bytes))
 
-        self.stats["writes"] += 1
+        self._writes += 1
 
     def delete(self, key: str) -> None:
         """Remove a key from cache.
@@ -121,14 +175,15 @@ class CacheLayer:
             key: Cache key
 
         """
-        cache_key = f"{self.cache_prefix}{key}"
-        meta_key = f"{self.metadata_prefix}{key}"
+        cache_key = self.cache_prefix + key
 
-        with Batch(self.db) as batch:
-            batch.delete(cache_key)
-            batch.delete(meta_key)
+        previous = self.db.get(cache_key)
+        self.db.delete(cache_key)
+        self._hot.pop(cache_key, None)
+        if previous:
+            self._track_removal(previous)
 
-        self.stats["evictions"] += 1
+        self._evictions += 1
 
     def clear_expired(self) -> int:
         """Remove all expired entries from cache.
@@ -137,77 +192,115 @@ class CacheLayer:
             Number of entries cleaned up
 
         """
-        expired_keys = []
-        current_time = datetime.now()
-
-        for key, value in self.db.scan(start_key=self.metadata_prefix):
-            if not key.startswith(self.metadata_prefix):
-                break
-            metadata = json.loads(value.decode())
-            expires_at = datetime.fromisoformat(metadata["expires_at"])
-            if current_time > expires_at:
-                original_key = metadata["key"]
-                expired_keys.append(original_key)
-
-        if expired_keys:
+        entries = list(self.db.scan(start_key=self.cache_prefix, end_key=self._cache_end))
+        expired_entries = _find_expired(entries, _time_ns())
+
+        if expired_entries:
             with Batch(self.db) as batch:
-                for original_key in expired_keys:
-                    batch.delete(f"{self.cache_prefix}{original_key}")
-                    batch.delete(f"{self.metadata_prefix}{original_key}")
-            self.stats["evictions"] += len(expired_keys)
+                for cache_key, _ in expired_entries:
+                    batch.delete(cache_key)
+            for cache_key, value in expired_entries:
+                self._hot.pop(cache_key, None)
+                self._track_removal(value)
+            self._evictions += len(expired_entries)
 
-        return len(expired_keys)
+        return len(expired_entries)
 
     def warm_cache(self, data_dict: Dict[str, Any], ttl: Optional[int] = None) -> int:
-        """Populate cache with multiple entries at once."""
+        """Populate cache with multiple entries in one batch, committed as a single WAL group."""
         ttl = ttl or self.default_ttl
-        current_time = datetime.now()
+        expires_ns = _time_ns() + ttl * 1_000_000_000
+
+        # Bind per-entry callables once; the loop body is the whole cost of a large warm-up
+        cache_prefix = self.cache_prefix
+        dumps = _dumps
+        header_pack = _pack
+        db_get = self.db.get
+
+        # Counter and hot-LRU updates are applied only once the batch has committed
+        added_entries = 0
+        added_bytes = 0
+        written_keys = []
 
         with Batch(self.db) as batch:
+            put = batch.put
             for key, value in data_dict.items():
-                cache_key = f"{self.cache_prefix}{key}"
-                meta_key = f"{self.metadata_prefix}{key}"
-                value_bytes = json.dumps(value).encode()
-                metadata = {
-                    "key": key,
-                    "created_at": current_time.isoformat(),
-                    "expires_at": (current_time + timedelta(seconds=ttl)).isoformat(),
-                    "ttl": ttl,
-                    "size_bytes": len(value_bytes),
-                }
-                batch.put(cache_key, value_bytes)
-                batch.put(meta_key, json.dumps(metadata).encode())
-
-        self.stats["writes"] += len(data_dict)
+                cache_key = cache_prefix + key
+                value_bytes = dumps(value)
+                size_bytes = len(value_bytes)
+                previous = db_get(cache_key)
+                if previous:
+                    added_bytes -= _unpack_from(previous)[1]
+                else:
+                    added_entries += 1
+                added_bytes += size_bytes
+                put(cache_key, header_pack(expires_ns, size_bytes) + value_bytes)
+                written_keys.append(cache_key)
+
+        self._entries += added_entries
+        self._bytes += added_bytes
+        hot_pop = self._hot.pop
+        for cache_key in written_keys:
+            hot_pop(cache_key, None)
+        self._writes += len(data_dict)
         return len(data_dict)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        total_requests = self.stats["hits"] + self.stats["misses"]
-        hit_rate = self.stats["hits"] / total_requests * 100 if total_requests > 0 else 0
-
-        cached_entries = 0
-        total_size = 0
-        for key, value in self.db.scan(start_key=self.metadata_prefix):
-            if not key.startswith(self.metadata_prefix):
-                break
-            metadata = json.loads(value.decode())
-            cached_entries += 1
-            total_size += metadata.get("size_bytes", 0)
+        total_requests = self._hits + self._misses
+        hit_rate = self._hits / total_requests * 100 if total_requests > 0 else 0
 
         db_stats = self.db.stats()
 
         return {
-            "cache_hits": self.stats["hits"],
-            "cache_misses": self.stats["misses"],
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
             "hit_rate_percent": hit_rate,
-            "total_writes": self.stats["writes"],
-            "total_evictions": self.stats["evictions"],
-            "current_entries": cached_entries,
-            "total_cached_size": total_size,
+            "total_writes": self._writes,
+            "total_evictions": self._evictions,
+            "current_entries": self._entries,
+            "total_cached_size": self._bytes,
             "memtable_size": db_stats["memtable"]["size"],
         }
 
+    def _purge_legacy_entries(self) -> int:
+        """Delete entries written in the pre-header layout, in one batch.
+
+        Returns:
+            Number of legacy keys removed
+
+        """
+        legacy_keys = [
+            key
+            for prefix in _LEGACY_PREFIXES
+            for key, _ in self.db.scan(start_key=prefix, end_key=_next_prefix(prefix))
+        ]
+        if legacy_keys:
+            with Batch(self.db) as batch:
+                for key in legacy_keys:
+                    batch.delete(key)
+        return len(legacy_keys)
+
+    def _remember(self, cache_key: str, expires_ns: int, payload: memoryview) -> None:
+        """Record an entry in the hot LRU, evicting the least recently used one if full."""
+        self._hot[cache_key] = (expires_ns, payload)
+        self._hot.move_to_end(cache_key)
+        if len(self._hot) > self.max_hot:
+            self._hot.popitem(last=False)
+
+    def _track_write(self, previous: Optional[bytes], size_bytes: int) -> None:
+        """Update running totals for a write that may have replaced an existing entry."""
+        if previous:
+            self._bytes -= _unpack_from(previous)[1]
+        else:
+            self._entries += 1
+        self._bytes += size_bytes
+
+    def _track_removal(self, cached_bytes: bytes) -> None:
+        """Update running totals for an entry that was removed from the database."""
+        self._entries -= 1
+        self._bytes -= _unpack_from(cached_bytes)[1]
+
     def close(self) -> None:
         """Close the cache."""
         self.db.close()
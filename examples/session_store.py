@@ -5,14 +5,60 @@ Replace Redis/Memcached with YellowDB for managing user sessions.
 Features: TTL expiration, user mapping, cleanup, statistics.
 """
 
-import json
 import secrets
+import struct
 import time
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from functools import partial
+from itertools import compress
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 from yellowdb import Batch, YellowDB
 
+# Header prepended to every session value: last_accessed in nanoseconds since the epoch.
+# Keeping it outside the JSON payload lets expiry checks read 8 bytes instead of decoding.
+_HDR = struct.Struct("<Q")
+_HDR_SIZE = _HDR.size
+_pack = _HDR.pack
+_unpack_from = _HDR.unpack_from
+
+_loads = orjson.loads
+_dumps = partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+_time_ns = time.time_ns
+
+
+def _next_prefix(prefix: str) -> str:
+    """Return the smallest key that sorts after every key starting with prefix."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _find_idle_sessions(
+    entries: List[Tuple[str, bytes]], cutoff_ns: int
+) -> List[Tuple[str, bytes]]:
+    """Return the stored sessions last accessed before cutoff_ns.
+
+    Reads only the last_accessed header of each value; the map/compress chain keeps
+    the per-session comparison out of Python bytecode.
+    """
+    last_accessed = map(itemgetter(0), map(_unpack_from, map(itemgetter(1), entries)))
+    return list(compress(entries, map(cutoff_ns.__gt__, last_accessed)))
+
+
+_SESSION_PREFIX = "session.v2:"
+_SESSION_PREFIX_LENGTH = len(_SESSION_PREFIX)
+_SESSION_END = _next_prefix(_SESSION_PREFIX)
+_USER_INDEX_PREFIX = "uidx:"
+# Sessions stored as bare JSON, before the header and user index existed
+_LEGACY_SESSION_PREFIX = "session:"
+_LEGACY_SESSION_END = _next_prefix(_LEGACY_SESSION_PREFIX)
+
+
+def _user_index_prefix(user_id: str) -> str:
+    """Return the key prefix shared by all user index entries of a user."""
+    return _USER_INDEX_PREFIX + user_id + ":"
+
 
 class SessionStore:
     """Persistent session storage using YellowDB."""
@@ -28,6 +74,29 @@ class SessionStore:
         self.db = YellowDB(data_directory=db_path)
         self.ttl_seconds = ttl_seconds
 
+        self._purge_legacy_sessions()
+
+        # Session count for get_stats; create/delete/cleanup keep it current
+        self._session_count = self.db.scan(start_key=_SESSION_PREFIX, end_key=_SESSION_END).count()
+
+    def _purge_legacy_sessions(self) -> int:
+        """Delete sessions written in the header-less layout, in one batch.
+
+        Their values cannot be read by this version and they have no user index
+        entries, so their users simply have to log in again.
+
+        Returns:
+            Number of legacy sessions removed.
+
+        """
+        legacy = self.db.scan(start_key=_LEGACY_SESSION_PREFIX, end_key=_LEGACY_SESSION_END)
+        legacy_keys = [key for key, _ in legacy]
+        if legacy_keys:
+            with Batch(self.db) as batch:
+                for key in legacy_keys:
+                    batch.delete(key)
+        return len(legacy_keys)
+
     def create_session(self, user_id: str, data: Dict[str, Any] = None) -> str:
         """Create a new session for user.
 
@@ -39,45 +108,71 @@ class SessionStore:
             Session ID.
 
         """
-        session_id = secrets.token_urlsafe(32)
-        key = f"session:{session_id}"
+        session_id = secrets.token_bytes(24).hex()
+        key = _SESSION_PREFIX + session_id
 
+        current_ns = _time_ns()
         session_data = {
             "session_id": session_id,
             "user_id": user_id,
-            "created_at": datetime.now().isoformat(),
-            "last_accessed": datetime.now().isoformat(),
+            "created_at": current_ns,
             "data": data or {},
         }
 
-        self.db.set(key, json.dumps(session_data).encode())
+        with Batch(self.db) as batch:
+            batch.put(key, self._encode(current_ns, session_data))
+            batch.put(_user_index_prefix(user_id) + session_id, b"")
+        self._session_count += 1
         return session_id
 
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_session(self, session_id: str, refresh: bool = True) -> Optional[Dict[str, Any]]:
         """Get session data, checking expiration.
 
         Args:
             session_id: Session ID.
+            refresh: Whether to slide the session's expiry forward on this read.
 
         Returns:
             Session data or None if expired.
 
         """
-        key = f"session:{session_id}"
+        return self._load_session(_SESSION_PREFIX + session_id, refresh)
+
+    def _load_session(self, key: str, refresh: bool = True) -> Optional[Dict[str, Any]]:
+        """Load a session by its storage key, checking expiration.
+
+        Args:
+            key: Storage key of the session.
+            refresh: Whether to slide the session's expiry forward on this read.
+
+        Returns:
+            Session data or None if missing or expired.
+
+        """
         session_bytes = self.db.get(key)
 
         if not session_bytes:
             return None
 
-        session_data = json.loads(session_bytes.decode())
-        last_accessed = datetime.fromisoformat(session_data["last_accessed"])
+        (last_accessed_ns,) = _unpack_from(session_bytes)
+        current_ns = _time_ns()
+        ttl_ns = self.ttl_seconds * 1_000_000_000
+        idle_ns = current_ns - last_accessed_ns
 
-        if datetime.now() - last_accessed > timedelta(seconds=self.ttl_seconds):
-            self.delete_session(session_id)
+        if idle_ns > ttl_ns:
+            self._delete_key(key, session_bytes)
             return None
 
-        session_data["last_accessed"] = datetime.now().isoformat()
-        self.db.set(key, json.dumps(session_data).encode())
+        payload = memoryview(session_bytes)[_HDR_SIZE:]
+
+        # Only slide the expiry once a tenth of the TTL has passed, so read-heavy
+        # traffic does not turn every lookup into a write
+        if refresh and idle_ns > ttl_ns // 10:
+            last_accessed_ns = current_ns
+            self.db.set(key, _pack(last_accessed_ns) + payload)
+
+        session_data = _loads(payload)
+        session_data["last_accessed"] = last_accessed_ns
         return session_data
 
     def update_session(self, session_id: str, data: Dict[str, Any]) -> bool:
@@ -91,15 +186,16 @@ class SessionStore:
             True if successful, False if session not found.
 
         """
-        session_data = self.get_session(session_id)
+        key = _SESSION_PREFIX + session_id
+        # The write below refreshes last_accessed, so the read must not write as well
+        session_data = self._load_session(key, refresh=False)
         if not session_data:
             return False
 
         session_data["data"].update(data)
-        session_data["last_accessed"] = datetime.now().isoformat()
+        del session_data["last_accessed"]
 
-        key = f"session:{session_id}"
-        self.db.set(key, json.dumps(session_data).encode())
+        self.db.set(key, self._encode(_time_ns(), session_data))
         return True
 
     def delete_session(self, session_id: str) -> None:
@@ -109,7 +205,22 @@ class SessionStore:
             session_id: Session ID.
 
         """
-        self.db.delete(f"session:{session_id}")
+        key = _SESSION_PREFIX + session_id
+        session_bytes = self.db.get(key)
+        if session_bytes:
+            self._delete_key(key, session_bytes)
+
+    def _delete_key(self, key: str, session_bytes: bytes) -> None:
+        """Delete a stored session and its user index entry."""
+        with Batch(self.db) as batch:
+            self._queue_delete(batch, key, session_bytes)
+        self._session_count -= 1
+
+    def _queue_delete(self, batch: Batch, key: str, session_bytes: bytes) -> None:
+        """Queue deletion of a stored session and its user index entry in a batch."""
+        user_id = _loads(memoryview(session_bytes)[_HDR_SIZE:])["user_id"]
+        batch.delete(key)
+        batch.delete(_user_index_prefix(user_id) + key[_SESSION_PREFIX_LENGTH:])
 
     def get_user_sessions(self, user_id: str) -> list:
         """Get all sessions for a user.
@@ -121,13 +232,14 @@ class SessionStore:
             List of session IDs.
 
         """
+        prefix = _user_index_prefix(user_id)
+        prefix_length = len(prefix)
         sessions = []
-        for key, value in self.db.scan(start_key="session:"):
-            if not key.startswith("session:"):
-                break
-            session_data = json.loads(value.decode())
-            if session_data["user_id"] == user_id:
-                sessions.append(session_data["session_id"])
+        for key, _ in self.db.scan(start_key=prefix, end_key=_next_prefix(prefix)):
+            session_id = key[prefix_length:]
+            # Skip entries of other users whose ID merely starts with "<user_id>:"
+            if ":" not in session_id:
+                sessions.append(session_id)
         return sessions
 
     def cleanup_expired_sessions(self) -> int:
@@ -137,22 +249,15 @@ class SessionStore:
             Number of sessions cleaned up.
 
         """
-        expired_sessions = []
-        current_time = datetime.now()
-
-        for key, value in self.db.scan(start_key="session:"):
-            if not key.startswith("session:"):
-                break
-            session_data = json.loads(value.decode())
-            last_accessed = datetime.fromisoformat(session_data["last_accessed"])
-
-            if current_time - last_accessed > timedelta(seconds=self.ttl_seconds):
-                expired_sessions.append(session_data["session_id"])
+        cutoff_ns = _time_ns() - self.ttl_seconds * 1_000_000_000
+        entries = list(self.db.scan(start_key=_SESSION_PREFIX, end_key=_SESSION_END))
+        expired_sessions = _find_idle_sessions(entries, cutoff_ns)
 
         if expired_sessions:
             with Batch(self.db) as batch:
-                for session_id in expired_sessions:
-                    batch.delete(f"session:{session_id}")
+                for key, value in expired_sessions:
+                    self._queue_delete(batch, key, value)
+            self._session_count -= len(expired_sessions)
 
         return len(expired_sessions)
 
@@ -163,16 +268,17 @@ class SessionStore:
             Dictionary with session stats.
 
         """
-        total_sessions = sum(
-            1 for key, _ in self.db.scan(start_key="session:") if key.startswith("session:")
-        )
         db_stats = self.db.stats()
         return {
-            "total_sessions": total_sessions,
+            "total_sessions": self._session_count,
             "memtable_size": db_stats["memtable"]["size"],
             "cache_entries": db_stats["cache"]["entries"],
         }
 
+    def _encode(self, last_accessed_ns: int, session_data: Dict[str, Any]) -> bytes:
+        """Serialize a session as its binary header followed by the JSON payload."""
+        return _pack(last_accessed_ns) + _dumps(session_data)
+
     def close(self) -> None:
         """Close the session store."""
         self.db.close()
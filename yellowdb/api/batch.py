@@ -88,8 +88,10 @@ class Batch:
     def commit(self) -> None:
         """Execute all queued operations atomically.
 
-        All operations are committed together. If any operation fails,
-        the batch may be partially committed depending on the failure point.
+        All operations are committed together under a single WAL group commit,
+        so the whole batch costs one log write (and one fsync when sync_wal is
+        enabled). If any operation fails, the batch may be partially committed
+        depending on the failure point.
 
         Raises:
             Exception: If any operation in the batch fails
@@ -101,11 +103,12 @@ class Batch:
             >>> batch.commit()
 
         """
-        for operation_type, key, value in self.operations:
-            if operation_type == "put":
-                self.database.set(key, value)
-            elif operation_type == "delete":
-                self.database.delete(key)
+        with self.database.group_commit():
+            for operation_type, key, value in self.operations:
+                if operation_type == "put":
+                    self.database.set(key, value)
+                elif operation_type == "delete":
+                    self.database.delete(key)
 
     def __enter__(self) -> "Batch":
         """Context manager entry.
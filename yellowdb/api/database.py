@@ -13,7 +13,8 @@ The YellowDB class manages:
 
 import threading
 import time
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
 
 from ..cache.write_through import WriteThroughCache
 from ..compaction.compactor import Compactor
@@ -22,7 +23,7 @@ from ..storage.memtable import ConcurrentMemtables, Memtable
 from ..storage.sstable import SSTable
 from ..storage.wal import WAL
 from ..utils.config import Config
-from ..utils.exceptions import DatabaseClosedError, InvalidKeyError, InvalidValueError
+from ..utils.exceptions import DatabaseClosedError, InvalidKeyError, InvalidValueError, WALError
 from .iterator import DatabaseIterator, RangeIterator
 
 
@@ -437,6 +438,44 @@ class YellowDB:
             except Exception:
                 raise
 
+    @contextmanager
+    def group_commit(self) -> Iterator[None]:
+        """Group a sequence of writes into a single WAL flush.
+
+        While the context is open, writes and deletes from this thread are applied
+        exclusively and their WAL records are buffered, then written (and fsynced,
+        if sync_wal is enabled) once when the context exits. This is how Batch
+        commits its operations.
+
+        If the body raises, buffered records are still flushed, but the body's
+        exception is what propagates, with its own cause chain intact; a WAL failure
+        during that flush is attached to it as a note rather than replacing it.
+
+        Raises:
+            DatabaseClosedError: If database is closed
+            WALError: If flushing the grouped records fails after a successful body
+
+        Example:
+            >>> with db.group_commit():
+            ...     for i in range(1000):
+            ...         db.set(f"key:{i}", b"value")
+
+        """
+        with self._lock:
+            if self._closed:
+                raise DatabaseClosedError("Database is closed")
+
+            self.wal.begin_group()
+            try:
+                yield
+            except BaseException as error:
+                try:
+                    self.wal.end_group()
+                except WALError as flush_error:
+                    error.add_note(f"WAL flush during group commit also failed: {flush_error!r}")
+                raise
+            self.wal.end_group()
+
     def flush(self) -> None:
         """Manually flush memtable to disk.
 
@@ -589,15 +628,19 @@ class YellowDB:
         """
         Serializer.clear_key_cache()
 
-    def scan(self, start_key: Optional[str] = None) -> DatabaseIterator:
+    def scan(
+        self, start_key: Optional[str] = None, end_key: Optional[str] = None
+    ) -> DatabaseIterator:
         """Scan all entries in the database in sorted key order.
 
-        Iterates through all key-value pairs from an optional start key onwards.
-        Results are returned in sorted order.
+        Iterates through all key-value pairs from an optional start key onwards,
+        stopping before an optional end key. Results are returned in sorted order.
 
         Args:
             start_key: Optional starting key. If provided, iteration begins from this key.
                       If None, starts from the beginning.
+            end_key: Optional exclusive end key. If provided, iteration stops before
+                    this key. If None, runs to the end of the database.
 
         Returns:
             DatabaseIterator instance for iterating over entries
@@ -612,10 +655,13 @@ class YellowDB:
             >>> for key, value in db.scan(start_key="user:100"):
             ...     print(f"{key}: {value}")
 
+            >>> for key, value in db.scan(start_key="user:", end_key="user;"):
+            ...     print(f"{key}: {value}")
+
         """
         if self._closed:
             raise DatabaseClosedError("Database is closed")
-        return DatabaseIterator(self.memtable, self.compactor, start_key)
+        return DatabaseIterator(self.memtable, self.compactor, start_key, end_key)
 
     def range(self, start_key: str, end_key: str) -> RangeIterator:
         """Query entries within a key range (inclusive on both ends).
@@ -14,14 +14,16 @@ from ..storage.memtable import ConcurrentMemtables
 class DatabaseIterator:
     """Iterator for scanning all entries in the database in sorted key order.
 
-    Iterates through all key-value pairs, optionally starting from a specific key.
-    Results are returned in sorted order and reflect the current state of the
-    database, including entries from memtable and all SSTables.
+    Iterates through all key-value pairs, optionally starting from a specific key
+    and stopping before an end key. Results are returned in sorted order and
+    reflect the current state of the database, including entries from memtable
+    and all SSTables.
 
     Attributes:
         memtable_source: Reference to the memtable(s)
         compactor: Reference to the compactor/SSTable manager
         start_key: Optional key to start iteration from
+        end_key: Optional key to stop iteration before
         _entries: List of (key, value) tuples after loading
         _current_index: Current position in the iteration
 
@@ -36,6 +38,11 @@ class DatabaseIterator:
         >>> for key, value in db.scan(start_key="user:100"):
         ...     print(f"{key}: {value}")
 
+        Scan a key prefix, stopping inside the iterator:
+
+        >>> for key, value in db.scan(start_key="user:", end_key="user;"):
+        ...     print(f"{key}: {value}")
+
         Count total entries:
 
         >>> iterator = db.scan()
@@ -43,13 +50,20 @@ class DatabaseIterator:
 
     """
 
-    def __init__(self, memtable_source, compactor: Compactor, start_key: Optional[str] = None):
+    def __init__(
+        self,
+        memtable_source,
+        compactor: Compactor,
+        start_key: Optional[str] = None,
+        end_key: Optional[str] = None,
+    ):
         """Initialize a database iterator.
 
         Args:
             memtable_source: Memtable or ConcurrentMemtables instance
             compactor: Compactor instance managing SSTables
             start_key: Optional key to start iteration from (inclusive)
+            end_key: Optional key to stop iteration before (exclusive)
 
         Note:
             Iterator loads all matching entries into memory, so it may use
@@ -59,6 +73,7 @@ class DatabaseIterator:
         self.memtable_source = memtable_source
         self.compactor = compactor
         self.start_key = start_key
+        self.end_key = end_key
 
         self._entries: List[Tuple[str, bytes]] = []
         self._current_index = 0
@@ -72,6 +87,9 @@ class DatabaseIterator:
         keeping the most recent version of each key (based on timestamp),
         and excluding deleted entries.
         """
+        start_key = self.start_key
+        end_key = self.end_key
+
         if isinstance(self.memtable_source, ConcurrentMemtables):
             memtable_data = self.memtable_source.get_all_entries()
         else:
@@ -80,7 +98,7 @@ class DatabaseIterator:
         memtable_entries = [
             (key, entry.value, entry.timestamp, entry.deleted)
             for key, entry in memtable_data.items()
-            if self.start_key is None or key >= self.start_key
+            if (start_key is None or key >= start_key) and (end_key is None or key < end_key)
         ]
 
         all_entries = {}
@@ -88,8 +106,10 @@ class DatabaseIterator:
             level = self.compactor.get_level(level_number)
             for sstable in level.get_sstables():
                 for key, value, timestamp, deleted in sstable.scan_all():
-                    if (self.start_key is None or key >= self.start_key) and (
-                        key not in all_entries or all_entries[key][1] < timestamp
+                    if (
+                        (start_key is None or key >= start_key)
+                        and (end_key is None or key < end_key)
+                        and (key not in all_entries or all_entries[key][1] < timestamp)
                     ):
                         all_entries[key] = (value, timestamp, deleted)
 
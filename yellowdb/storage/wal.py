@@ -98,6 +98,7 @@ class WAL:
 
     Features:
         - Batched writes for improved performance
+        - Group commit of multi-operation batches
         - Automatic file rotation
         - Configurable synchronization (fsync) policies
         - Thread-safe operations using reentrant locks
@@ -135,6 +136,7 @@ class WAL:
         self._entry_count = 0
         self._current_wal_size = 0
         self._batch_size_counter = 0
+        self._group_depth = 0
 
         self._batch_lock = threading.Lock()
         self._batch = WALBatch(self.config.wal_batch_size)
@@ -277,7 +279,9 @@ class WAL:
                 batch_full = self._batch.add_entry(record)
                 self._batch_size_counter += len(record)
 
-                if batch_full or self._batch_size_counter >= self.config.wal_sync_interval:
+                if self._group_depth == 0 and (
+                    batch_full or self._batch_size_counter >= self.config.wal_sync_interval
+                ):
                     self._flush_batch()
 
                 self._entry_count += 1
@@ -285,6 +289,44 @@ class WAL:
             except Exception as e:
                 raise WALError(f"Failed to write to WAL: {e}") from e
 
+    def begin_group(self) -> None:
+        """Start a group commit, deferring batch flushes until the group ends.
+
+        Records written while a group is open accumulate in the batch buffer and are
+        written (and fsynced, if sync_wal is enabled) once by the matching end_group
+        call. Groups may be nested; only the outermost end_group flushes. Rotation
+        and close still flush pending records immediately.
+
+        Example:
+            >>> wal.begin_group()
+            >>> try:
+            ...     wal.write("key1", b"value1", 1234567890)
+            ...     wal.write("key2", b"value2", 1234567891)
+            ... finally:
+            ...     wal.end_group()
+
+        """
+        with self._lock:
+            self._group_depth += 1
+
+    def end_group(self) -> None:
+        """End a group commit started by begin_group.
+
+        Flushes all records written during the group in a single write when the
+        outermost group ends.
+
+        Raises:
+            WALError: If flushing the batch fails.
+
+        """
+        with self._lock:
+            if self._group_depth == 0:
+                return
+
+            self._group_depth -= 1
+            if self._group_depth == 0 and self._current_wal_handle:
+                self._flush_batch()
+
     def rotate(self) -> Optional[Path]:
         """Rotate to a new WAL file, closing the current one.
 